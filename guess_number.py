@@ -1,19 +1,33 @@
 ''' use different algorithm to make a guessing game , and see which get the answer faster , 
 make different implemetation ,'''
 
-# noobie version 
+# noobie version
 # A simple number guessing game
 
+import sys
+
 number = 46
-user_guess = 0  # Initialize user_guess to a number that is not correct
+
+# read stdin through its buffered reader instead of calling input() per guess :
+# readline fills 8KB at a time , so piped/scripted runs cost ~1 syscall per 8KB
+# instead of one prompt write + one read per guess
+_stdin = sys.stdin
+_is_tty = _stdin.isatty()
+
+def _prompt(text):
+    # only bother writing the prompt for a real terminal , skip it when piped
+    if _is_tty:
+        sys.stdout.write(text)
+        sys.stdout.flush()
 
 # Loop until the user guesses the correct number
-while user_guess != number:
+_prompt("Guess a number between 1 and 100: ")
+for line in iter(_stdin.readline, ''):
     try:
-        user_guess_str = input("Guess a number between 1 and 100: ")
-        user_guess = int(user_guess_str)
+        user_guess = int(line)
     except ValueError:
         print("That's not a valid number! Please guess again.")
+        _prompt("Guess a number between 1 and 100: ")
         continue  # Skip to the next iteration of the loop
 
     # Check if the guess is within the valid range
@@ -23,32 +37,111 @@ while user_guess != number:
     # Check the user's guess against the correct number
     elif user_guess < number:
         print("Your guess is too low. Guess again!")
-    
+
     elif user_guess > number:
         print("Your guess is too high. Guess again!")
 
     else:
         print("Congratulations! You guessed the right number!")
+        break
+
+    _prompt("Guess a number between 1 and 100: ")
 
 ''' -----------------second part code-------------------------------- '''
 # import random
 
+import ctypes
 import random
-def binary_search(target, low, high):
+from array import array
+from numba import cfunc, njit, int64, types
+
+# the hot loop lives in its own jitted helper : explicit signature so it
+# compiles at import time , and no print inside (that stays in the wrapper)
+@njit(int64(int64, int64, int64), cache=True, nogil=True)
+def _bsearch(target, low, high):
         guess = 0
  # i don't make a copy because there are non mutable type val (low,high)
         while low <= high:
-                mid = (low + high ) // 2
+                mid = (low + high) >> 1
+                guess += 1
+                if mid == target:
+                        return guess
+                # branchless bound update : the unpredictable lower/higher
+                # decision becomes arithmetic LLVM can lower to cmov
+                goes_right = int(mid < target)
+                low = low * (1 - goes_right) + (mid + 1) * goes_right
+                high = high * goes_right + (mid - 1) * (1 - goes_right)
+        return -1
+
+# raw C entry point over the same body : cfunc skips the njit dispatcher
+# (per-call type check + unboxing) , so a harness can hammer the search
+# millions of times through the ctypes wrapper at ~zero call overhead
+binary_search_cfunc = cfunc(
+        types.int64(types.int64, types.int64, types.int64), cache=True
+)(_bsearch.py_func)
+
+binary_search_capi = ctypes.CFUNCTYPE(
+        ctypes.c_int64, ctypes.c_int64, ctypes.c_int64, ctypes.c_int64
+)(binary_search_cfunc.address)
+
+def binary_search(target, low, high, trace=False):
+        if trace:
+                # debug path : pure python , collect every midpoint and
+                # print them once at the end instead of one I/O per probe
+                mids = []
+                guess = 0
+                while low <= high:
+                        mid = (low + high) >> 1
+                        guess += 1
+                        mids.append(mid)
+                        if mid == target:
+                                print(*mids)
+                                return guess
+                        elif mid < target:
+                                low = mid + 1
+                        else:
+                                high = mid - 1
+                print(*mids)
+                return None
+        guess = _bsearch(target, low, high)
+        if guess == -1:
+                return None
+        return guess
+
+def _build_mid_table(low, high):
+        # the midpoints only depend on the bounds , so flatten the whole
+        # decision tree into a heap-layout array once at import time
+        depth = (high - low + 1).bit_length()
+        table = array('i', bytes(4 * (1 << depth)))  # zero-filled , 0 = no node
+        stack = [(0, low, high)]
+        while stack:
+                i, lo, hi = stack.pop()
+                if lo > hi:
+                        continue
+                mid = (lo + hi) >> 1
+                table[i] = mid
+                stack.append((2 * i + 1, lo, mid - 1))
+                stack.append((2 * i + 2, mid + 1, hi))
+        return table
+
+_MID_100K = _build_mid_table(1, 100000)
+
+def binary_search_100k(target):
+        # specialized for the fixed 1..100000 range : walk the precomputed
+        # tree , no midpoint or bounds arithmetic per step
+        table = _MID_100K
+        size = len(table)
+        i = 0
+        guess = 0
+        while i < size and table[i] != 0:
+                mid = table[i]
                 guess += 1
-                print(mid)
-                if mid  == target:
+                if mid == target:
                         return guess
-                elif mid < target:
-                        low = mid + 1
-                else:
-                        high = mid - 1
+                i = 2 * i + 2 if mid < target else 2 * i + 1
         return None
 
 target = random.randint(1,100000)
 
 binary_search(target,1, 100000)
+binary_search_100k(target)  # specialized version , same guess count
@@ -1,218 +1,380 @@
-# Singly Linked List in Python — from scratch, with a short demo
-from __future__ import annotations
-from dataclasses import dataclass
-from typing import Any, Callable, Iterable, Iterator, Optional
-
-@dataclass
-class _Node:
-    value: Any
-    next: Optional["_Node"] = None
-
-class SinglyLinkedList:
-    """
-    Minimal, well-behaved singly linked list.
-    O(1): prepend, append (amortized constant with tail pointer), pop_left
-    O(n): get, set, insert (by index), remove (by value), pop (from end), find, reverse (but in-place & O(1) extra space)
-    """
-    def __init__(self, iterable: Optional[Iterable[Any]] = None) -> None:
-        self.head: Optional[_Node] = None
-        self.tail: Optional[_Node] = None
-        self._len = 0
-        if iterable:
-            for x in iterable:
-                self.append(x)
-
-    def __len__(self) -> int:
-        return self._len
-
-    def __iter__(self) -> Iterator[Any]:
-        cur = self.head
-        while cur:
-            yield cur.value
-            cur = cur.next
-
-    def __repr__(self) -> str:
-        return f"SinglyLinkedList([{', '.join(repr(x) for x in self)}])"
-
-    # ---- Core helpers ----
-    def _node_at(self, index: int) -> _Node:
-        """Return node at index (0-based). Raise IndexError if out of range."""
-        if index < 0 or index >= self._len:
-            raise IndexError("index out of range")
-        cur = self.head
-        for _ in range(index):
-            assert cur is not None
-            cur = cur.next
-        assert cur is not None
-        return cur
-
-    # ---- Fast O(1) operations ----
-    def prepend(self, value: Any) -> None:
-        """Insert at head in O(1)."""
-        node = _Node(value, self.head)
-        self.head = node
-        if self.tail is None:  # first element
-            self.tail = node
-        self._len += 1
-
-    def append(self, value: Any) -> None:
-        """Insert at tail in O(1) with tail pointer."""
-        node = _Node(value, None)
-        if self.tail is None:
-            self.head = self.tail = node
-        else:
-            self.tail.next = node
-            self.tail = node
-        self._len += 1
-
-    def pop_left(self) -> Any:
-        """Remove from head in O(1)."""
-        if self.head is None:
-            raise IndexError("pop_left from empty list")
-        node = self.head
-        self.head = node.next
-        if self.head is None:  # list became empty
-            self.tail = None
-        self._len -= 1
-        return node.value
-
-    # ---- O(n) operations (require traversal) ----
-    def get(self, index: int) -> Any:
-        return self._node_at(index).value
-
-    def set(self, index: int, value: Any) -> None:
-        self._node_at(index).value = value
-
-    def insert(self, index: int, value: Any) -> None:
-        """Insert before position index. index==len is append."""
-        if index < 0 or index > self._len:
-            raise IndexError("index out of range")
-        if index == 0:
-            self.prepend(value)
-            return
-        if index == self._len:
-            self.append(value)
-            return
-        prev = self._node_at(index - 1)
-        node = _Node(value, prev.next)
-        prev.next = node
-        self._len += 1
-
-    def pop(self) -> Any:
-        """Remove last item. O(n) because singly list must find prev of tail."""
-        if self.head is None:
-            raise IndexError("pop from empty list")
-        if self.head is self.tail:
-            val = self.head.value
-            self.head = self.tail = None
-            self._len -= 1
-            return val
-        # find node before tail
-        prev = self.head
-        while prev.next is not self.tail:
-            prev = prev.next
-            assert prev is not None
-        assert self.tail is not None
-        val = self.tail.value
-        prev.next = None
-        self.tail = prev
-        self._len -= 1
-        return val
-
-    def remove(self, value: Any) -> bool:
-        """Remove first occurrence of value; return True if found."""
-        prev = None
-        cur = self.head
-        while cur:
-            if cur.value == value:
-                if prev is None:
-                    self.head = cur.next
-                else:
-                    prev.next = cur.next
-                if cur is self.tail:
-                    self.tail = prev
-                self._len -= 1
-                return True
-            prev, cur = cur, cur.next
-        return False
-
-    def find(self, predicate: Callable[[Any], bool]) -> Optional[int]:
-        """Return index of first value matching predicate; else None."""
-        idx = 0
-        cur = self.head
-        while cur:
-            if predicate(cur.value):
-                return idx
-            idx += 1
-            cur = cur.next
-        return None
-
-    def reverse(self) -> None:
-        """In-place O(n), O(1) extra space."""
-        prev = None
-        cur = self.head
-        self.tail = self.head
-        while cur:
-            nxt = cur.next
-            cur.next = prev
-            prev = cur
-            cur = nxt
-        self.head = prev
-
-
-# ---- Demo: show when each method is useful ----
-def demo():
-    print("Create with iterable & append (queue-like build):")
-    ll = SinglyLinkedList([1, 2, 3])
-    print(" start:", ll)
-    ll.append(4)     # O(1)
-    ll.append(5)
-    print(" after appends:", ll)
-
-    print("\nPrepend (stack-at-head or building reversed):")
-    ll2 = SinglyLinkedList()
-    for x in [3, 2, 1]:
-        ll2.prepend(x)  # O(1)
-    print(" built via prepend:", ll2)
-
-    print("\nQueue operations (FIFO): append -> pop_left")
-    q = SinglyLinkedList()
-    for job in ["A", "B", "C"]:
-        q.append(job)           # enqueue
-    print(" queue:", q)
-    print(" dequeue:", q.pop_left())  # O(1)
-    print(" queue now:", q)
-
-    print("\nStack using head (LIFO): prepend -> pop_left")
-    st = SinglyLinkedList()
-    for x in [10, 20, 30]:
-        st.prepend(x)  # push
-    print(" stack:", st)
-    print(" pop:", st.pop_left())  # pop
-    print(" stack now:", st)
-
-    print("\nInsert in middle (needs traversal):")
-    print(" before:", ll)
-    ll.insert(2, 99)  # O(n)
-    print(" after insert at index 2:", ll)
-
-    print("\nRemove a value (first occurrence):")
-    print(" before:", ll)
-    ll.remove(3)  # O(n)
-    print(" after remove 3:", ll)
-
-    print("\nPop last (singly list must traverse):")
-    print(" before:", ll)
-    print(" popped:", ll.pop())  # O(n)
-    print(" after:", ll)
-
-    print("\nReverse in-place:")
-    print(" before:", ll)
-    ll.reverse()  # O(n)
-    print(" after:", ll)
-
-    print("\nFind by predicate (first even):")
-    idx = ll.find(lambda v: v % 2 == 0)
-    print(" first even index:", idx, "value:", ll.get(idx) if idx is not None else None)
-
-demo()
+# Singly Linked List in Python — from scratch, with a short demo
+from __future__ import annotations
+from array import array
+from collections import deque
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+class SinglyLinkedList:
+    """
+    Minimal, well-behaved singly linked list.
+    Storage is structure-of-arrays: values live in one list and the "next
+    pointers" are indices into a parallel int array (-1 means no node), so
+    traversal walks a contiguous array instead of chasing per-node heap
+    objects. Freed slots are recycled through a free-list.
+    O(1): prepend, append (amortized constant with tail pointer), pop_left,
+          pop (from end, when the prev-of-tail cache is warm)
+    O(n): get, set, insert (by index), remove (by value), pop (cold cache), find, reverse (but in-place & O(1) extra space)
+    Random-access get stays O(n) per call; bulk access via get_many or
+    slicing is O(n + k) for k sorted indices.
+    For plain queue/stack workloads, prefer collections.deque (C-coded,
+    block-allocated, 5-20x faster); use SinglyLinkedList when you need
+    O(1) splicing or pedagogical clarity.
+    """
+    # fixed attribute layout, like a C struct: no per-instance __dict__
+    __slots__ = ("_val", "_nxt", "_free", "_head", "_tail", "_prev_tail", "_len")
+
+    def __init__(self, iterable: Optional[Iterable[Any]] = None) -> None:
+        self._val: list[Any] = []
+        self._nxt = array('i')
+        self._free = -1  # head of the free-list of recycled slots
+        self._head = -1
+        self._tail = -1
+        self._prev_tail = -1  # node before tail, -1 when unknown or len <= 1
+        self._len = 0
+        if iterable is not None:
+            # bulk path: materialize the values once and lay the next-links
+            # out as one contiguous run, instead of N append() calls
+            vals = list(iterable)
+            n = len(vals)
+            if n:
+                self._val = vals
+                self._nxt = array('i', range(1, n + 1))
+                self._nxt[n - 1] = -1
+                self._head = 0
+                self._tail = n - 1
+                self._prev_tail = n - 2 if n >= 2 else -1
+                self._len = n
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[Any]:
+        # hoist the arrays to locals: LOAD_FAST per step instead of LOAD_ATTR
+        val, nxt = self._val, self._nxt
+        cur = self._head
+        while cur != -1:
+            yield val[cur]
+            cur = nxt[cur]
+
+    def __repr__(self) -> str:
+        # walk the arrays directly into a list: str.join gets a real list
+        # and no generator frame is created per element
+        val, nxt = self._val, self._nxt
+        parts = []
+        cur = self._head
+        while cur != -1:
+            parts.append(repr(val[cur]))
+            cur = nxt[cur]
+        return f"SinglyLinkedList([{', '.join(parts)}])"
+
+    # ---- Core helpers ----
+    def _alloc(self, value: Any) -> int:
+        """Grab a storage slot for value and return its index."""
+        i = self._free
+        if i == -1:
+            self._val.append(value)
+            self._nxt.append(-1)
+            return len(self._val) - 1
+        self._free = self._nxt[i]
+        self._val[i] = value
+        self._nxt[i] = -1
+        return i
+
+    def _release(self, i: int) -> None:
+        """Put slot i back on the free-list."""
+        self._val[i] = None  # drop the value reference
+        self._nxt[i] = self._free
+        self._free = i
+
+    def _node_at(self, index: int) -> int:
+        """Return storage slot of node at index (0-based). Raise IndexError if out of range."""
+        if index < 0 or index >= self._len:
+            raise IndexError("index out of range")
+        nxt = self._nxt
+        cur = self._head
+        # invariant: cur != -1 throughout, since 0 <= index < self._len
+        for _ in range(index):
+            cur = nxt[cur]
+        return cur
+
+    # ---- Fast O(1) operations ----
+    def prepend(self, value: Any) -> None:
+        """Insert at head in O(1)."""
+        i = self._alloc(value)
+        self._nxt[i] = self._head
+        self._head = i
+        if self._tail == -1:  # first element
+            self._tail = i
+        self._len += 1
+        if self._len == 2:  # new head sits right before the tail
+            self._prev_tail = i
+
+    def append(self, value: Any) -> None:
+        """Insert at tail in O(1) with tail pointer."""
+        i = self._alloc(value)
+        if self._tail == -1:
+            self._head = self._tail = i
+        else:
+            self._nxt[self._tail] = i
+            self._prev_tail = self._tail  # old tail is now prev of tail
+            self._tail = i
+        self._len += 1
+
+    def extend(self, iterable: Iterable[Any]) -> None:
+        """Append every item of iterable; amortized O(1) per item.
+
+        Keeps tail, free-list head and count in locals for the whole run
+        and writes the object state back once at the end, instead of the
+        ~6 attribute reads/writes a plain append() costs per element.
+        """
+        val, nxt = self._val, self._nxt
+        tail = self._tail
+        free = self._free
+        prev = self._prev_tail
+        n = 0
+        for x in iterable:
+            if free == -1:
+                val.append(x)
+                nxt.append(-1)
+                i = len(val) - 1
+            else:
+                i = free
+                free = nxt[i]
+                val[i] = x
+                nxt[i] = -1
+            if tail == -1:
+                self._head = i
+            else:
+                nxt[tail] = i
+            prev = tail
+            tail = i
+            n += 1
+        self._tail = tail
+        self._free = free
+        self._prev_tail = prev
+        self._len += n
+
+    def pop_left(self) -> Any:
+        """Remove from head in O(1)."""
+        if self._head == -1:
+            raise IndexError("pop_left from empty list")
+        i = self._head
+        val = self._val[i]
+        self._head = self._nxt[i]
+        if self._head == -1:  # list became empty
+            self._tail = -1
+        if i == self._prev_tail:  # list is down to one node
+            self._prev_tail = -1
+        self._release(i)
+        self._len -= 1
+        return val
+
+    # ---- O(n) operations (require traversal) ----
+    def get(self, index: int) -> Any:
+        return self._val[self._node_at(index)]
+
+    def get_many(self, sorted_indices: Iterable[int]) -> Iterator[Any]:
+        """Yield values at ascending indices using one forward walk.
+
+        O(n + k) for k sorted lookups, vs O(k*n) for k separate get() calls.
+        """
+        val, nxt = self._val, self._nxt
+        cur = self._head
+        pos = 0
+        for idx in sorted_indices:
+            if idx < 0 or idx >= self._len:
+                raise IndexError("index out of range")
+            if idx < pos:
+                raise ValueError("indices must be sorted ascending")
+            while pos < idx:
+                cur = nxt[cur]
+                pos += 1
+            yield val[cur]
+
+    def __getitem__(self, index: Any) -> Any:
+        """Index like a list; slices are served by a single get_many walk."""
+        if isinstance(index, slice):
+            rng = range(*index.indices(self._len))
+            if rng.step < 0:
+                return list(self.get_many(rng[::-1]))[::-1]
+            return list(self.get_many(rng))
+        return self.get(index)
+
+    def set(self, index: int, value: Any) -> None:
+        self._val[self._node_at(index)] = value
+
+    def insert(self, index: int, value: Any) -> None:
+        """Insert before position index. index==len is append."""
+        if index < 0 or index > self._len:
+            raise IndexError("index out of range")
+        if index == 0:
+            self.prepend(value)
+            return
+        if index == self._len:
+            self.append(value)
+            return
+        prev = self._node_at(index - 1)
+        i = self._alloc(value)
+        self._nxt[i] = self._nxt[prev]
+        self._nxt[prev] = i
+        if self._nxt[i] == self._tail:  # slid in right before the tail
+            self._prev_tail = i
+        self._len += 1
+
+    def pop(self) -> Any:
+        """Remove last item. O(1) with a warm prev-of-tail cache, else O(n)."""
+        if self._head == -1:
+            raise IndexError("pop from empty list")
+        if self._head == self._tail:
+            i = self._head
+            val = self._val[i]
+            self._head = self._tail = -1
+            self._release(i)
+            self._len -= 1
+            return val
+        prev = self._prev_tail
+        if prev == -1:
+            # cold cache: find node before tail the slow way
+            nxt, tail = self._nxt, self._tail
+            prev = self._head
+            while nxt[prev] != tail:
+                prev = nxt[prev]
+        i = self._tail
+        val = self._val[i]
+        self._nxt[prev] = -1
+        self._tail = prev
+        self._prev_tail = -1  # prev of the new tail is unknown
+        self._release(i)
+        self._len -= 1
+        return val
+
+    def remove(self, value: Any) -> bool:
+        """Remove first occurrence of value; return True if found."""
+        val, nxt = self._val, self._nxt
+        prev = -1
+        cur = self._head
+        while cur != -1:
+            v = val[cur]
+            # identity first, like list.remove: skips __eq__ dispatch when
+            # the caller passes the very same object (or an interned value)
+            if v is value or v == value:
+                if prev == -1:
+                    self._head = nxt[cur]
+                else:
+                    nxt[prev] = nxt[cur]
+                if cur == self._tail:
+                    self._tail = prev
+                    self._prev_tail = -1  # prev of the new tail is unknown
+                elif cur == self._prev_tail:
+                    self._prev_tail = prev
+                self._release(cur)
+                self._len -= 1
+                return True
+            prev, cur = cur, nxt[cur]
+        return False
+
+    def find(self, predicate: Callable[[Any], bool]) -> Optional[int]:
+        """Return index of first value matching predicate; else None."""
+        val, nxt, pred = self._val, self._nxt, predicate
+        idx = 0
+        cur = self._head
+        while cur != -1:
+            if pred(val[cur]):
+                return idx
+            idx += 1
+            cur = nxt[cur]
+        return None
+
+    def reverse(self) -> None:
+        """In-place O(n), O(1) extra space."""
+        head = self._head
+        if head == -1:
+            return  # empty: tail is already -1, nothing to write
+        nxt_arr = self._nxt
+        # the old second node ends up right before the new tail (old head)
+        new_prev_tail = nxt_arr[head]
+        prev = -1
+        cur = head
+        while cur != -1:
+            nxt = nxt_arr[cur]
+            nxt_arr[cur] = prev
+            prev = cur
+            cur = nxt
+        # loop touches only locals; write the object state back once
+        self._head = prev
+        self._tail = head
+        self._prev_tail = new_prev_tail
+
+
+# ---- Demo: show when each method is useful ----
+def demo():
+    print("Create with iterable & append (queue-like build):")
+    ll = SinglyLinkedList([1, 2, 3])
+    print(" start:", ll)
+    ll.append(4)     # O(1)
+    ll.append(5)
+    print(" after appends:", ll)
+
+    print("\nPrepend (stack-at-head or building reversed):")
+    ll2 = SinglyLinkedList()
+    for x in [3, 2, 1]:
+        ll2.prepend(x)  # O(1)
+    print(" built via prepend:", ll2)
+
+    print("\nQueue operations (FIFO): append -> pop_left")
+    q = SinglyLinkedList()
+    for job in ["A", "B", "C"]:
+        q.append(job)           # enqueue
+    print(" queue:", q)
+    print(" dequeue:", q.pop_left())  # O(1)
+    print(" queue now:", q)
+
+    # same workload with deque — the right tool for a plain FIFO
+    dq = deque()
+    for job in ["A", "B", "C"]:
+        dq.append(job)          # enqueue
+    print(" deque queue:", list(dq))
+    print(" deque dequeue:", dq.popleft())
+    print(" deque queue now:", list(dq))
+
+    print("\nStack using head (LIFO): prepend -> pop_left")
+    st = SinglyLinkedList()
+    for x in [10, 20, 30]:
+        st.prepend(x)  # push
+    print(" stack:", st)
+    print(" pop:", st.pop_left())  # pop
+    print(" stack now:", st)
+
+    # same workload with deque used as a stack
+    ds = deque()
+    for x in [10, 20, 30]:
+        ds.appendleft(x)  # push
+    print(" deque stack:", list(ds))
+    print(" deque pop:", ds.popleft())
+    print(" deque stack now:", list(ds))
+
+    print("\nInsert in middle (needs traversal):")
+    print(" before:", ll)
+    ll.insert(2, 99)  # O(n)
+    print(" after insert at index 2:", ll)
+
+    print("\nRemove a value (first occurrence):")
+    print(" before:", ll)
+    ll.remove(3)  # O(n)
+    print(" after remove 3:", ll)
+
+    print("\nPop last (singly list must traverse):")
+    print(" before:", ll)
+    print(" popped:", ll.pop())  # O(n)
+    print(" after:", ll)
+
+    print("\nReverse in-place:")
+    print(" before:", ll)
+    ll.reverse()  # O(n)
+    print(" after:", ll)
+
+    print("\nFind by predicate (first even):")
+    idx = ll.find(lambda v: v % 2 == 0)
+    print(" first even index:", idx, "value:", ll.get(idx) if idx is not None else None)
+
+demo()